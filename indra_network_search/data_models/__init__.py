@@ -32,6 +32,7 @@ from pydantic import (
     BaseModel,
     Extra,
     HttpUrl,
+    PrivateAttr,
     confloat,
     conint,
     conlist,
@@ -176,6 +177,10 @@ class NetworkSearchQuery(BaseModel):
     terminal_ns: List[str] = []
     format: str = "json"  # This attribute is probably obsolete now
 
+    # Per-instance caches; private attributes are excluded from dict()/json()
+    _query_hash: Optional[int] = PrivateAttr(default=None)
+    _filter_options: Optional[FilterOptions] = PrivateAttr(default=None)
+
     @validator("path_length")
     def is_positive_int(cls, pl: int):
         """Validate path_length >= 1 if given"""
@@ -222,14 +227,23 @@ class NetworkSearchQuery(BaseModel):
 
     def get_hash(self):
         """Get the corresponding query hash of the query"""
-        return get_query_hash(self.dict(), ignore_keys=["format"])
+        # The query is immutable, so the hash only needs to be computed
+        # once per instance
+        if self._query_hash is None:
+            self._query_hash = get_query_hash(self.dict(), ignore_keys=["format"])
+        return self._query_hash
 
     def reverse_search(self):
         """Return a copy of the query with source and target switched"""
-        model_copy = self.copy(deep=True).dict(exclude={"source", "target"})
-        source = self.target
-        target = self.source
-        return self.__class__(source=source, target=target, **model_copy)
+        # The instance is already validated and immutable, so skip the
+        # deepcopy + re-validation round-trip and rebuild with construct();
+        # list fields get shallow copies to keep the copies independent.
+        data = {
+            name: list(value) if isinstance(value, list) else value
+            for name, value in ((f, self.__dict__[f]) for f in self.__fields__)
+        }
+        data["source"], data["target"] = self.target, self.source
+        return self.__class__.construct(**data)
 
     def get_int_sign(self) -> Optional[int]:
         """Return the integer representation of the sign"""
@@ -249,7 +263,14 @@ class NetworkSearchQuery(BaseModel):
 
     def get_filter_options(self) -> FilterOptions:
         """Returns the filter options"""
-        return FilterOptions(
+        # The query is immutable, so the filter options only need to be
+        # built once per instance
+        if self._filter_options is not None:
+            return self._filter_options
+        # Compute the context weighting once and derive the overall
+        # weighting from it instead of re-checking the mesh ids twice
+        context_weighted = self.is_context_weighted()
+        filter_options = FilterOptions(
             stmt_filter=self.stmt_filter,
             allowed_ns=self.allowed_ns,
             node_blacklist=self.node_blacklist,
@@ -258,13 +279,12 @@ class NetworkSearchQuery(BaseModel):
             curated_db_only=self.curated_db_only,
             max_paths=self.k_shortest,
             cull_best_node=self.cull_best_node,
-            overall_weighted=self.is_overall_weighted(),
-            weighted=WEIGHT_NAME_MAPPING.get(self.weighted),
-            context_weighted=is_context_weighted(
-                mesh_id_list=self.mesh_ids,
-                strict_filtering=self.strict_mesh_id_filtering,
-            ),
+            overall_weighted=context_weighted or self.weighted in ("belief", "z_score"),
+            weighted=WEIGHT_NAME_MAPPING[self.weighted],
+            context_weighted=context_weighted,
         )
+        self._filter_options = filter_options
+        return filter_options
 
 
 # Models for the run options
@@ -429,7 +449,11 @@ class StmtTypeSupport(BaseModel):
 
     def set_source_counts(self):
         """Updates the source count field from the set statement data"""
-        self.source_counts = sum([Counter(**sd.source_counts) for sd in self.statements], Counter())
+        # Counter.update merges in C without intermediate Counter objects
+        source_counts = Counter()
+        for sd in self.statements:
+            source_counts.update(sd.source_counts)
+        self.source_counts = source_counts
 
 
 class EdgeData(BaseModel):
@@ -452,10 +476,10 @@ class EdgeData(BaseModel):
 
     def set_source_counts(self):
         """Updates the source count from the contained data in self.statements"""
-        self.source_counts = sum(
-            [Counter(**sts.source_counts) for sts in self.statements.values()],
-            Counter(),
-        )
+        source_counts = Counter()
+        for sts in self.statements.values():
+            source_counts.update(sts.source_counts)
+        self.source_counts = source_counts
 
 
 class EdgeDataByHash(BaseModel):
@@ -608,10 +632,15 @@ def basemodels_equal(
     :
         True if the two models are equal
     """
-    b1d = basemodel.dict(exclude=exclude)
-    b2d = other_basemodel.dict(exclude=exclude)
+    # Compare the instance dicts directly instead of materializing new
+    # dicts with .dict(exclude=...) for every comparison; guard on key
+    # membership so differing key sets compare unequal instead of raising
+    b1d = basemodel.__dict__
+    b2d = other_basemodel.__dict__
     qual_func = any if any_item else all
-    return qual_func(_equals(b1d[k1], b2d[k2], any_item) for k1, k2 in zip(b1d, b2d))
+    if exclude:
+        return qual_func(k in b2d and _equals(v, b2d[k], any_item) for k, v in b1d.items() if k not in exclude)
+    return qual_func(k in b2d and _equals(v, b2d[k], any_item) for k, v in b1d.items())
 
 
 def _equals(
@@ -625,11 +654,32 @@ def _equals(
     elif isinstance(d1, (str, int, float)):
         return d1 == d2
     elif isinstance(d1, (list, tuple)):
+        # Sequences of scalars (e.g. filter lists) can be compared at
+        # C level instead of recursing per element
+        if (
+            not any_item
+            and isinstance(d2, (list, tuple))
+            and len(d1) == len(d2)
+            and (not d1 or not isinstance(d1[0], (list, tuple, dict, set, BaseModel)))
+        ):
+            return d1 == d2 if type(d1) is type(d2) else list(d1) == list(d2)
         return qual_func(_equals(e1, e2, any_item) for e1, e2 in zip(d1, d2))
     elif isinstance(d1, set):
         return d1 == d2
+    elif isinstance(d1, BaseModel):
+        return isinstance(d2, BaseModel) and basemodels_equal(d1, d2, any_item)
     elif isinstance(d1, dict):
-        return qual_func(_equals(d1[k1], d2[k2], False) for k1, k2 in zip(d1, d2))
+        # Compare by key instead of zipping the two key orders, which is
+        # wrong for dicts with different insertion order
+        if not isinstance(d2, dict):
+            return False
+        if not any_item:
+            if len(d1) != len(d2):
+                return False
+            # Flat dicts of scalars can use the C-level dict comparison
+            if not any(isinstance(v, (dict, list, tuple, set, BaseModel)) for v in d1.values()):
+                return d1 == d2
+        return qual_func(k in d2 and _equals(v, d2[k], False) for k, v in d1.items())
     else:
         raise TypeError(f"Unable to do comparison of type {type(d1)}")
 
@@ -660,13 +710,11 @@ def basemodel_in_iterable(
         True if basemodel is found in the collection
     """
     return any(
-        [
-            basemodels_equal(
-                basemodel=basemodel,
-                other_basemodel=ob,
-                any_item=any_item,
-                exclude=exclude,
-            )
-            for ob in iterable
-        ]
+        basemodels_equal(
+            basemodel=basemodel,
+            other_basemodel=ob,
+            any_item=any_item,
+            exclude=exclude,
+        )
+        for ob in iterable
     )
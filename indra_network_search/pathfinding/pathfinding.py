@@ -2,19 +2,9 @@
 Pathfinding algorithms local to this repository
 """
 import logging
-from itertools import islice, product
-from typing import (
-    Any,
-    Callable,
-    Dict,
-    Generator,
-    Iterator,
-    List,
-    Optional,
-    Set,
-    Tuple,
-    Union,
-)
+from functools import lru_cache
+from heapq import nlargest, nsmallest
+from typing import Any, Callable, Dict, FrozenSet, Iterator, List, Optional, Set, Tuple
 
 from depmap_analysis.network_functions.famplex_functions import (
     common_parent,
@@ -25,8 +15,12 @@ from networkx import DiGraph
 
 from indra_network_search.rest_util import StrNode, StrNodeSeq
 
+# Both are pure lookups keyed on (ns, id) and the same entities recur
+# across queries, so memoize them at module scope
+ns_id_to_name = lru_cache(maxsize=16384)(ns_id_to_name)
+get_identifiers_url = lru_cache(maxsize=16384)(get_identifiers_url)
+
 logger = logging.getLogger(__name__)
-FilterOption = Union[List[str], List[int], float, None]
 
 __all__ = [
     "shared_interactors",
@@ -72,25 +66,23 @@ def shared_parents(
         An iterator of parents to source and target, each parent being a
         tuple of (name, namespace, id, lookup URL)
     """
-    sp_set = common_parent(
-        id1=source_id,
-        id2=target_id,
-        ns1=source_ns,
-        ns2=target_ns,
+    sp_set = _cached_common_parent(
+        source_ns=source_ns,
+        source_id=source_id,
+        target_ns=target_ns,
+        target_id=target_id,
         immediate_only=immediate_only,
-        is_a_part_of=is_a_part_of,
+        is_a_part_of=frozenset(is_a_part_of) if is_a_part_of else None,
     )
-    return islice(
-        sorted(
-            [
-                (ns_id_to_name(n, i) or "", n, i, get_identifiers_url(n, i))
-                for n, i in sp_set
-                # sort on name, ns, id
-            ],
-            key=lambda t: (t[0], t[1], t[2]),
-        ),
+    # Select the top max_paths parents on (name, ns, id) with a bounded
+    # heap, then only build lookup URLs for the selected ones
+    name_by_parent = {(n, i): ns_id_to_name(n, i) or "" for n, i in sp_set}
+    top_parents = nsmallest(
         max_paths,
+        sp_set,
+        key=lambda ni: (name_by_parent[ni], ni[0], ni[1]),
     )
+    return iter([(name_by_parent[(n, i)], n, i, get_identifiers_url(n, i)) for n, i in top_parents])
 
 
 def shared_interactors(
@@ -107,7 +99,7 @@ def shared_interactors(
     node_blacklist: Optional[List[str]] = None,
     belief_cutoff: float = 0.0,
     curated_db_only: bool = False,
-) -> Iterator[Tuple[List[StrNode], List[StrNode]]]:
+) -> Iterator[Tuple[Tuple[StrNode, StrNode], Tuple[StrNode, StrNode]]]:
     """Get shared regulators or targets and filter them based on sign
 
     Closely resembles get_st and get_sr from
@@ -154,16 +146,26 @@ def shared_interactors(
         An iterator of regulators or targets to source and target as edges
     """
 
-    def _get_min_max_belief(node: StrNode):
-        s_edge = (node, source) if regulators else (source, node)
-        t_edge = (node, target) if regulators else (target, node)
-        s_max: float = max([sd["belief"] for sd in graph.edges[s_edge]["statements"]])
-        t_max: float = max([sd["belief"] for sd in graph.edges[t_edge]["statements"]])
-        return min(s_max, t_max)
+    # Normalize the filter collections to lowercased frozensets once so
+    # the per-node and per-statement membership checks are O(1)
+    allowed_ns = frozenset(ns.lower() for ns in allowed_ns) if allowed_ns else None
+    stmt_types = frozenset(s.lower() for s in stmt_types) if stmt_types else None
+    source_filter = frozenset(s.lower() for s in source_filter) if source_filter else None
 
+    # The adjacency dicts give the same edge data as graph.edges[edge]
+    # without going through EdgeView.__getitem__ per lookup
     neigh = graph.pred if regulators else graph.succ
-    s_neigh: Set[StrNode] = set(neigh[source])
-    t_neigh: Set[StrNode] = set(neigh[target])
+    s_adj = neigh[source]
+    t_adj = neigh[target]
+
+    def _get_min_max_belief(node: StrNode):
+        return min(_edge_max_belief(s_adj[node]), _edge_max_belief(t_adj[node]))
+
+    # Intersect the raw neighbor sets before any filtering: every filter
+    # below keeps or drops a node based on its own attributes or edges,
+    # so filtering the (typically much smaller) intersection once is
+    # equivalent to filtering each neighbor set and then intersecting
+    intermediates: Set[StrNode] = s_adj.keys() & t_adj.keys()
 
     # If signed, filter sign
     # Sign is handled different here than in the depmap explanations - if
@@ -172,58 +174,45 @@ def shared_interactors(
     # shared targets and upregulates source & target in the case of shared
     # regulators.
     if sign is not None:
-        s_neigh, t_neigh = _sign_filter(source, s_neigh, target, t_neigh, sign, regulators)
+        intermediates = _sign_filter(source, target, intermediates, sign, regulators)
 
-    # Filter nodes
+    # Filter nodes; in-place set difference against a frozenset beats a
+    # comprehension with per-element list membership tests
     if node_blacklist:
-        s_neigh = {n for n in s_neigh if n not in node_blacklist}
-        t_neigh = {n for n in t_neigh if n not in node_blacklist}
+        intermediates -= frozenset(node_blacklist)
 
     # Filter ns
     if allowed_ns:
-        s_neigh = _namespace_filter(s_neigh, graph, allowed_ns)
-        t_neigh = _namespace_filter(t_neigh, graph, allowed_ns)
-
-    # Filter statements type
-    if stmt_types:
-        st_args = (graph, regulators, stmt_types)
-        s_neigh = _stmt_types_filter(source, s_neigh, *st_args)
-        t_neigh = _stmt_types_filter(target, t_neigh, *st_args)
-
-    # Filter curated db
-    if curated_db_only:
-        curated_args = (graph, regulators)
-        s_neigh = _filter_curated(source, s_neigh, *curated_args)
-        t_neigh = _filter_curated(target, t_neigh, *curated_args)
-
-    # Filter hashes
-    if hash_blacklist:
-        hash_args = (graph, regulators, hash_blacklist)
-        s_neigh = _hash_filter(source, s_neigh, *hash_args)
-        t_neigh = _hash_filter(target, t_neigh, *hash_args)
-
-    # Filter belief
-    if belief_cutoff > 0:
-        belief_args = (graph, regulators, belief_cutoff)
-        s_neigh = _belief_filter(source, s_neigh, *belief_args)
-        t_neigh = _belief_filter(target, t_neigh, *belief_args)
-
-    # Filter source
-    if source_filter:
-        src_args = (graph, regulators, source_filter)
-        s_neigh = _source_filter(source, s_neigh, *src_args)
-        t_neigh = _source_filter(target, t_neigh, *src_args)
-
-    intermediates = s_neigh & t_neigh
-
-    interm_sorted = sorted(intermediates, key=_get_min_max_belief, reverse=True)
-
-    # Return generator of edge pairs sorted by lowest highest belief of
+        intermediates = _namespace_filter(intermediates, graph, allowed_ns)
+
+    # Fuse the statement-level filters into one predicate so each edge
+    # is visited once and its statement list walked at most once,
+    # instead of one pass (and one new set) per active filter
+    edge_pred = _make_edge_predicate(
+        stmt_types=stmt_types,
+        source_filter=source_filter,
+        hash_blacklist=hash_blacklist,
+        belief_cutoff=belief_cutoff,
+        curated_db_only=curated_db_only,
+    )
+    if edge_pred is not None and intermediates:
+        intermediates = {n for n in intermediates if edge_pred(s_adj[n]) and edge_pred(t_adj[n])}
+
+    # Compute the belief score once per node instead of once per sort
+    # comparison
+    belief_by_node = {n: _get_min_max_belief(n) for n in intermediates}
+    # Only the top max_results nodes are returned, so a bounded heap
+    # selection beats sorting the full intersection
+    interm_sorted = nlargest(max_results, intermediates, key=belief_by_node.__getitem__)
+
+    # Return edge pairs sorted by lowest highest belief; the selection
+    # is already truncated to max_results, so build the list outright
+    # instead of paying generator resumption per element. Tuples are
+    # cheaper to allocate than lists and stay hashable for downstream
+    # consumers.
     if regulators:
-        path_gen: Generator = (([x, source], [x, target]) for x in interm_sorted)
-    else:
-        path_gen: Generator = (([source, x], [target, x]) for x in interm_sorted)
-    return islice(path_gen, max_results)
+        return iter([((x, source), (x, target)) for x in interm_sorted])
+    return iter([((source, x), (target, x)) for x in interm_sorted])
 
 
 def direct_multi_interactors(
@@ -278,80 +267,91 @@ def direct_multi_interactors(
         # then pick the lowest of the beliefs in that list, i.e. the node
         # with the best "worst" performance gets ranked highest
         edges = [(neigh_node, inp_n) if rev else (inp_n, neigh_node) for inp_n in input_nodes]
-        max_beliefs = [max(sd["belief"] for sd in graph.edges[e]["statements"]) for e in edges]
-        return min(max_beliefs)
+        return min(_edge_max_belief(graph.edges[e]) for e in edges)
 
     reverse = not downstream
     neigh_lookup = graph.succ if downstream else graph.pred
     if not len(nodes):
         raise ValueError("Interactor list must contain at least one node")
 
-    # Get neighbors
-    if len(nodes) == 1:
-        neighbors = set(neigh_lookup[nodes[0]])
-    else:
-        first_node = nodes[0]
-        neighbors = set(neigh_lookup[first_node])
-        if neighbors:
-            for neigh in nodes[1:]:
-                neighbors.intersection_update(set(neigh_lookup[neigh]))
-
-    # Apply node filters
-    if allowed_ns and neighbors:
-        neighbors = list(_namespace_filter(graph=graph, nodes=neighbors, allowed_ns=allowed_ns))
-    if node_blacklist and neighbors:
-        neighbors = [n for n in neighbors if n not in node_blacklist]
-
-    # Apply edge type filters
-    filter_args = (
-        nodes,
-        neighbors,
-        graph,
-        reverse,
-    )
-    if stmt_types and neighbors:
-        neighbors = _run_edge_filter(*filter_args, filter_func=_stmt_types_filter, filter_option=stmt_types)
+    # Normalize the filter collections to lowercased frozensets once so
+    # the per-node and per-statement membership checks are O(1)
+    allowed_ns = frozenset(ns.lower() for ns in allowed_ns) if allowed_ns else None
+    stmt_types = frozenset(s.lower() for s in stmt_types) if stmt_types else None
+    source_filter = frozenset(s.lower() for s in source_filter) if source_filter else None
 
-    if source_filter and neighbors:
-        neighbors = _run_edge_filter(*filter_args, filter_func=_source_filter, filter_option=source_filter)
+    # Get neighbors; seed from the smallest adjacency and intersect the
+    # rest in one C-level call, which also probes the adjacency dicts
+    # without materializing their key sets
+    adjacencies = sorted((neigh_lookup[n] for n in nodes), key=len)
+    neighbors = set(adjacencies[0]).intersection(*adjacencies[1:])
 
-    if hash_blacklist and neighbors:
-        neighbors = _run_edge_filter(*filter_args, filter_func=_hash_filter, filter_option=hash_blacklist)
-
-    if belief_cutoff > 0 and neighbors:
-        neighbors = _run_edge_filter(*filter_args, filter_func=_belief_filter, filter_option=belief_cutoff)
-
-    if curated_db_only and neighbors:
-        neighbors = _run_edge_filter(*filter_args, filter_func=_filter_curated, filter_option=None)
+    # Apply node filters; subtract the blacklist in-place while neighbors
+    # is still a set
+    if node_blacklist and neighbors:
+        neighbors -= frozenset(node_blacklist)
+    # _namespace_filter already returns a set; keep neighbors a set until
+    # the final sort
+    if allowed_ns and neighbors:
+        neighbors = _namespace_filter(graph=graph, nodes=neighbors, allowed_ns=allowed_ns)
+
+    # Apply the statement-level filters fused into a single predicate;
+    # each input-node edge is then visited once regardless of how many
+    # filters are active
+    edge_pred = _make_edge_predicate(
+        stmt_types=stmt_types,
+        source_filter=source_filter,
+        hash_blacklist=hash_blacklist,
+        belief_cutoff=belief_cutoff,
+        curated_db_only=curated_db_only,
+    )
+    if edge_pred is not None and neighbors:
+        input_adjs = [neigh_lookup[inp_n] for inp_n in nodes]
+        neighbors = {n for n in neighbors if all(edge_pred(adj[n]) for adj in input_adjs)}
 
-    # Sort by min of the max of the edge beliefs, then by node degree
+    # Select the top max_results by min of the max of the edge beliefs
+    # with a bounded heap instead of sorting the full neighbor set; the
+    # belief score is computed once per neighbor up front
     if neighbors:
-        neighbors = sorted(
-            neighbors,
-            reverse=True,
-            key=lambda n: (
-                _get_min_max_belief(n, input_nodes=nodes, rev=reverse),
-                n,
-            ),
-        )
-        return islice(neighbors, max_results)
+        belief_by_node = {n: _get_min_max_belief(n, input_nodes=nodes, rev=reverse) for n in neighbors}
+        top_neighbors = nlargest(max_results, neighbors, key=lambda n: (belief_by_node[n], n))
+        return iter(top_neighbors)
     return iter([])
 
 
+@lru_cache(maxsize=4096)
+def _cached_common_parent(
+    source_ns: str,
+    source_id: str,
+    target_ns: str,
+    target_id: str,
+    immediate_only: bool,
+    is_a_part_of: Optional[FrozenSet[str]],
+) -> Set[Tuple[str, str]]:
+    # The ontology traversal in common_parent is pure in its arguments
+    # and the same entity pairs recur across queries, so cache it here;
+    # is_a_part_of must already be hashable (frozenset or None)
+    return common_parent(
+        id1=source_id,
+        id2=target_id,
+        ns1=source_ns,
+        ns2=target_ns,
+        immediate_only=immediate_only,
+        is_a_part_of=is_a_part_of,
+    )
+
+
 def _sign_filter(
     source: Tuple[str, int],
-    s_neigh: Set[Tuple[str, int]],
     target: Tuple[str, int],
-    t_neigh: Set[Tuple[str, int]],
+    candidates: Set[Tuple[str, int]],
     sign: Optional[int],
     regulators: bool,
-):
-    # Check that nodes are signed
-    try:
-        assert isinstance(source, tuple)
-        assert isinstance(target, tuple)
-    except AssertionError as err:
-        raise ValueError("Input nodes are not signed") from err
+) -> Set[Tuple[str, int]]:
+    # Check that nodes are signed; plain conditionals instead of
+    # assert statements, which are stripped when running with -O
+    if not (isinstance(source, tuple) and isinstance(target, tuple)):
+        raise ValueError("Input nodes are not signed")
     # Check that signs are proper
     if sign not in {0, 1}:
         raise ValueError(f"Unknown sign {sign}")
@@ -359,178 +359,109 @@ def _sign_filter(
     if regulators:
         # source and target sign match requested sign, neighbors are
         # always + signed
-        try:
-            assert source[1] == sign
-            assert target[1] == sign
-        except AssertionError as err:
-            raise ValueError("Node sign does not match requested sign") from err
+        if source[1] != sign or target[1] != sign:
+            raise ValueError("Node sign does not match requested sign")
 
         # Regulators can only have + sign
         # Find regulators that upregulate both source & target
         # Find regulators that downregulate both source & target
+        return {n for n in candidates if n[1] == 0}
+
+    # Match target sign with requested sign
+    return {n for n in candidates if n[1] == sign}
+
+
+def _edge_summary(edge_dict: Dict[str, Any]) -> Dict[str, Any]:
+    # Lazily cache per-edge aggregates of the statement list on the edge
+    # dict itself; every filter the edge is subjected to afterwards is an
+    # O(1) check against the summary instead of a scan of the statements
+    summary = edge_dict.get("_summary")
+    if summary is None:
+        max_belief = 0.0
+        stmt_types = set()
+        sources = set()
+        hashes = set()
+        curated = False
+        for sd in edge_dict["statements"]:
+            if sd["belief"] > max_belief:
+                max_belief = sd["belief"]
+            stmt_types.add(sd["stmt_type"].lower())
+            source_counts = sd["source_counts"]
+            if isinstance(source_counts, dict):
+                sources.update(s.lower() for s in source_counts)
+            if sd["curated"]:
+                curated = True
+            hashes.add(sd["stmt_hash"])
+        summary = {
+            "max_belief": max_belief,
+            "stmt_types": frozenset(stmt_types),
+            "sources": frozenset(sources),
+            "curated": curated,
+            "hashes": frozenset(hashes),
+        }
+        edge_dict["_summary"] = summary
+    return summary
+
+
+def _edge_max_belief(edge_dict: Dict[str, Any]) -> float:
+    return _edge_summary(edge_dict)["max_belief"]
+
+
+def _get_ns_lower_map(graph: DiGraph) -> Dict[StrNode, str]:
+    # Build the node -> lowercased namespace map once per graph and cache
+    # it on the graph itself; repeated per-node attribute dict lookups
+    # dominate the namespace filter on large neighbor sets otherwise
+    ns_lower_map = graph.graph.get("_ns_lower_map")
+    if ns_lower_map is None:
+        ns_lower_map = {n: data.get("ns", "").lower() for n, data in graph.nodes(data=True)}
+        graph.graph["_ns_lower_map"] = ns_lower_map
+    return ns_lower_map
+
+
+def _namespace_filter(nodes: StrNodeSeq, graph: DiGraph, allowed_ns: FrozenSet[str]) -> Set[StrNode]:
+    # allowed_ns is assumed to be lowercased by the caller
+    ns_lower_map = _get_ns_lower_map(graph)
+    return {x for x in nodes if ns_lower_map[x] in allowed_ns}
+
+
+def _make_edge_predicate(
+    stmt_types: Optional[FrozenSet[str]] = None,
+    source_filter: Optional[FrozenSet[str]] = None,
+    hash_blacklist: Optional[Set[int]] = None,
+    belief_cutoff: float = 0.0,
+    curated_db_only: bool = False,
+) -> Optional[Callable[[Dict[str, Any]], bool]]:
+    # Compose the active edge filters into a single predicate over an
+    # edge data dict. With the cached per-edge summary every check is
+    # O(1) against precomputed aggregates, so the per-filter semantics
+    # ("keep the edge if any statement satisfies the condition") carry
+    # over directly. Returns None if no filter is active.
+    # stmt_types and source_filter are assumed to be lowercased sets
+    # built once by the caller.
+    checks: List[Callable[[Dict[str, Any]], bool]] = []
+    if curated_db_only:
+        checks.append(lambda edge_dict: _edge_summary(edge_dict)["curated"])
+    if belief_cutoff > 0:
+        checks.append(lambda edge_dict: _edge_summary(edge_dict)["max_belief"] > belief_cutoff)
+    if hash_blacklist:
+        # Keep edge if *any* hash is *not* in blacklist, i.e. if the
+        # edge's hashes are not a subset of the blacklist
+        hash_set = hash_blacklist if isinstance(hash_blacklist, (set, frozenset)) else frozenset(hash_blacklist)
+        checks.append(lambda edge_dict: not hash_set.issuperset(_edge_summary(edge_dict)["hashes"]))
+    if stmt_types:
+        checks.append(lambda edge_dict: not _edge_summary(edge_dict)["stmt_types"].isdisjoint(stmt_types))
+    if source_filter:
+        checks.append(lambda edge_dict: not _edge_summary(edge_dict)["sources"].isdisjoint(source_filter))
 
-        s_neigh: Set[str] = {s for s in s_neigh if s[1] == 0}
-        t_neigh: Set[str] = {t for t in t_neigh if t[1] == 0}
-    else:
-        # Match target sign with requested sign
-        s_neigh: Set[str] = {s for s in s_neigh if s[1] == sign}
-        t_neigh: Set[str] = {t for t in t_neigh if t[1] == sign}
-
-    return s_neigh, t_neigh
-
-
-def _namespace_filter(nodes: StrNodeSeq, graph: DiGraph, allowed_ns: List[str]) -> Set[StrNode]:
-    return {x for x in nodes if graph.nodes[x]["ns"].lower() in allowed_ns}
+    if not checks:
+        return None
+    if len(checks) == 1:
+        return checks[0]
 
+    def _edge_predicate(edge_dict: Dict[str, Any]) -> bool:
+        return all(check(edge_dict) for check in checks)
 
-def _stmt_types_filter(
-    start_node: StrNode,
-    neighbor_nodes: Set[StrNode],
-    graph: DiGraph,
-    reverse: bool,
-    stmt_types: List[str],
-) -> Set[StrNode]:
-    # Sort to ensure edge_iter is co-ordered
-    if isinstance(start_node, tuple):
-        node_list = sorted(neighbor_nodes, key=lambda t: t[0])
-    else:
-        node_list = sorted(neighbor_nodes)
-
-    edge_iter = product(node_list, [start_node]) if reverse else product([start_node], node_list)
-
-    # Check which edges have the allowed stmt types
-    filtered_neighbors: Set[StrNode] = set()
-    for n, edge in zip(node_list, edge_iter):
-        stmt_list = graph.edges[edge]["statements"]
-        if any(sd["stmt_type"].lower() in stmt_types for sd in stmt_list):
-            filtered_neighbors.add(n)
-    return filtered_neighbors
-
-
-def _source_filter(
-    start_node: StrNode,
-    neighbor_nodes: Set[StrNode],
-    graph: DiGraph,
-    reverse: bool,
-    sources: List[str],
-) -> Set[StrNode]:
-    # Sort to ensure edge_iter is co-ordered
-    if isinstance(start_node, tuple):
-        node_list = sorted(neighbor_nodes, key=lambda t: t[0])
-    else:
-        node_list = sorted(neighbor_nodes)
-
-    edge_iter = product(node_list, [start_node]) if reverse else product([start_node], node_list)
-
-    # Check which edges have the allowed sources
-    filtered_neighbors: Set[StrNode] = set()
-    for n, edge in zip(node_list, edge_iter):
-        for sd in graph.edges[edge]["statements"]:
-            if isinstance(sd["source_counts"], dict) and any([s.lower() in sources for s in sd["source_counts"]]):
-                filtered_neighbors.add(n)
-                break
-    return filtered_neighbors
-
-
-def _filter_curated(
-    start_node: StrNode,
-    neighbor_nodes: Set[StrNode],
-    graph: DiGraph,
-    reverse: bool,
-) -> Set[StrNode]:
-    # Sort to ensure edge_iter is co-ordered
-    if isinstance(start_node, tuple):
-        # If signed, order on name, not sign
-        node_list = sorted(neighbor_nodes, key=lambda t: t[0])
-    else:
-        node_list = sorted(neighbor_nodes)
-
-    edge_iter = product(node_list, [start_node]) if reverse else product([start_node], node_list)
-
-    # Filter out edges without support from databases
-    filtered_neighbors = set()
-    for n, edge in zip(node_list, edge_iter):
-        stmt_list = graph.edges[edge]["statements"]
-        if any(sd["curated"] for sd in stmt_list):
-            filtered_neighbors.add(n)
-    return filtered_neighbors
-
-
-def _hash_filter(
-    start_node: StrNode,
-    neighbor_nodes: Set[StrNode],
-    graph: DiGraph,
-    reverse: bool,
-    hashes: List[int],
-) -> Set[StrNode]:
-    # Sort to ensure edge_iter is co-ordered
-    if isinstance(start_node, tuple):
-        # If signed, order on name, not sign
-        node_list = sorted(neighbor_nodes, key=lambda t: t[0])
-    else:
-        node_list = sorted(neighbor_nodes)
-
-    edge_iter = product(node_list, [start_node]) if reverse else product([start_node], node_list)
-
-    # Filter out edges without support from databases
-    filtered_neighbors = set()
-    for n, edge in zip(node_list, edge_iter):
-        stmt_list = graph.edges[edge]["statements"]
-
-        # Add node if *any* hash is *not* in blacklist
-        for sd in stmt_list:
-            if sd["stmt_hash"] not in hashes:
-                filtered_neighbors.add(n)
-                break
-    return filtered_neighbors
-
-
-def _belief_filter(
-    start_node: StrNode,
-    neighbor_nodes: Set[StrNode],
-    graph: DiGraph,
-    reverse: bool,
-    belief_cutoff: float,
-) -> Set[StrNode]:
-    # Sort to ensure edge_iter is co-ordered
-    if isinstance(start_node, tuple):
-        # If signed, order on name, not sign
-        node_list = sorted(neighbor_nodes, key=lambda t: t[0])
-    else:
-        node_list = sorted(neighbor_nodes)
-
-    edge_iter = product(node_list, [start_node]) if reverse else product([start_node], node_list)
-
-    # Filter out edges with belief below the cutoff
-    filtered_neighbors = set()
-    for n, edge in zip(node_list, edge_iter):
-        stmt_list = graph.edges[edge]["statements"]
-
-        # Add node if *any* belief score is *above* cutoff
-        for sd in stmt_list:
-            if sd["belief"] > belief_cutoff:
-                filtered_neighbors.add(n)
-                break
-    return filtered_neighbors
-
-
-def _run_edge_filter(
-    start_nodes: StrNodeSeq,
-    neighbor_nodes: Set[StrNode],
-    g: DiGraph,
-    rev: bool,
-    filter_option: FilterOption,
-    filter_func: Callable[[StrNode, Set[StrNode], DiGraph, bool, Optional[FilterOption]], Set[StrNode]],
-):
-    for start_node in start_nodes:
-        if not neighbor_nodes:
-            return neighbor_nodes
-        if filter_option is None:
-            neighbor_nodes = filter_func(start_node, neighbor_nodes, g, rev)
-        else:
-            neighbor_nodes = filter_func(start_node, neighbor_nodes, g, rev, filter_option)
-
-    return neighbor_nodes
+    return _edge_predicate
 
 
 def get_subgraph_edges(graph: DiGraph, nodes: List[Dict[str, str]]) -> Iterator[Tuple[str, str]]:
@@ -550,6 +481,9 @@ def get_subgraph_edges(graph: DiGraph, nodes: List[Dict[str, str]]) -> Iterator[
         the graph. For each node, two lists are provided for in-edges
         and out-edges respectively
     """
-    node_names = [n["name"] for n in nodes]
-    subgraph = graph.subgraph(nodes=node_names)
-    return iter(subgraph.edges)
+    # Only walk the out-edges of the query nodes instead of building a
+    # SubGraph view, whose edge iteration touches adjacency dicts for
+    # every node the view considers
+    name_set = {n["name"] for n in nodes}
+    succ = graph.succ
+    return ((u, v) for u in name_set if u in succ for v in succ[u] if v in name_set)
@@ -3,11 +3,23 @@ This file contains the Query classes mapping incoming rest queries to
 different algorithms used in the search api.
 """
 import logging
-from itertools import product
-from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Type, Union
+import time
+from functools import lru_cache
+from types import MappingProxyType
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    Union,
+)
 
 import networkx as nx
-from depmap_analysis.network_functions.net_functions import SIGNS_TO_INT_SIGN
 from indra.explanation.pathfinding import (
     EdgeFilter,
     bfs_search,
@@ -48,6 +60,18 @@ __all__ = [
 logger = logging.getLogger(__name__)
 
 
+# Reuse one CurationCache across queries and refresh the blacklist at
+# most once per TTL window instead of scanning the curations database on
+# every multi interactors query
+_curation_cache = CurationCache()
+_CURATION_TTL = 300  # seconds
+
+
+@lru_cache(maxsize=1)
+def _get_hash_blacklist(time_bucket: int) -> FrozenSet[int]:
+    return frozenset(_curation_cache.get_all_hashes())
+
+
 class MissingParametersError(Exception):
     """Raise for missing query parameters"""
 
@@ -56,16 +80,20 @@ class InvalidParametersError(Exception):
     """Raise when conflicting or otherwise invalid parameters"""
 
 
-alg_func_mapping = {
-    bfs_search.__name__: bfs_search,
-    shortest_simple_paths.__name__: shortest_simple_paths,
-    open_dijkstra_search.__name__: open_dijkstra_search,
-    shared_parents.__name__: shared_parents,
-    shared_interactors.__name__: shared_interactors,
-    "shared_regulators": shared_interactors,
-    "shared_targets": shared_interactors,
-    get_subgraph_edges.__name__: get_subgraph_edges,
-}
+# Keyed by bare algorithm name strings and frozen as read-only mappings;
+# the names match the functions' __name__ and the alg_name class attributes
+alg_func_mapping = MappingProxyType(
+    {
+        "bfs_search": bfs_search,
+        "shortest_simple_paths": shortest_simple_paths,
+        "open_dijkstra_search": open_dijkstra_search,
+        "shared_parents": shared_parents,
+        "shared_interactors": shared_interactors,
+        "shared_regulators": shared_interactors,
+        "shared_targets": shared_interactors,
+        "get_subgraph_edges": get_subgraph_edges,
+    }
+)
 
 
 class Query:
@@ -79,15 +107,27 @@ class Query:
     alg_name: str = NotImplemented  # String with name of algorithm function
     options = NotImplemented  # options model
 
+    # Queries are created per request on the REST hot path; slots avoid
+    # a per-instance __dict__ and speed up attribute access
+    __slots__ = ("query", "query_hash", "_int_sign", "_node_blacklist")
+
     def __init__(self, query: NetworkSearchQuery):
         self.query: NetworkSearchQuery = query
         self.query_hash: str = query.get_hash()
+        # The integer sign is used repeatedly in the option builders;
+        # resolve it from the query once
+        self._int_sign: Optional[int] = query.get_int_sign()
+        self._node_blacklist: Optional[Tuple[Tuple[str, int], ...]] = None
 
-    def _get_node_blacklist(self) -> List[Union[str, Tuple[str, int]]]:
+    def _get_node_blacklist(self) -> Union[List[str], Tuple[Tuple[str, int], ...]]:
         if not self.query.node_blacklist or self.query.sign is None:
             return self.query.node_blacklist
-        else:
-            return list(product(self.query.node_blacklist, [0, 1]))
+        if self._node_blacklist is None:
+            # Build the signed blacklist once per query instance; the
+            # consumers only iterate it, so an immutable tuple is enough
+            blacklist = self.query.node_blacklist
+            self._node_blacklist = tuple([(n, 0) for n in blacklist] + [(n, 1) for n in blacklist])
+        return self._node_blacklist
 
     def api_options(self) -> Dict[str, Any]:
         """These options are used when IndraNetworkSearchAPI handles the query
@@ -100,8 +140,10 @@ class Query:
         :
             A dict of ApiOptions
         """
-        return ApiOptions(
-            sign=self.query.get_int_sign(),
+        # The values come straight off the validated rest query, so skip
+        # re-validating them
+        return ApiOptions.construct(
+            sign=self._int_sign,
             fplx_expand=self.query.fplx_expand,
             user_timeout=self.query.user_timeout,
             two_way=self.query.two_way,
@@ -125,6 +167,8 @@ class Query:
 class UIQuery(Query):
     """Parent Class for all possible queries that come from the web UI"""
 
+    __slots__ = ("hash_blacklist", "_src_tgt")
+
     def alg_options(self) -> Dict[str, Any]:
         raise NotImplementedError
 
@@ -137,18 +181,22 @@ class UIQuery(Query):
     def __init__(self, query: NetworkSearchQuery, hash_blacklist: Optional[Set[int]] = None):
         super().__init__(query=query)
         self.hash_blacklist = hash_blacklist or set()
+        self._src_tgt: Optional[Tuple[StrNode, StrNode]] = None
 
     def _get_source_target(self) -> Tuple[StrNode, StrNode]:
         """Use for source-target searches"""
-        if self.query.sign is not None:
-            if self.query.get_int_sign() == 0:
-                return (self.query.source, 0), (self.query.target, 0)
-            elif self.query.get_int_sign() == 1:
-                return (self.query.source, 0), (self.query.target, 1)
+        # Both alg_options and result_options need the pair; build it once
+        if self._src_tgt is None:
+            if self.query.sign is not None:
+                if self._int_sign == 0:
+                    self._src_tgt = (self.query.source, 0), (self.query.target, 0)
+                elif self._int_sign == 1:
+                    self._src_tgt = (self.query.source, 0), (self.query.target, 1)
+                else:
+                    raise ValueError(f"Unknown sign {self.query.sign}")
             else:
-                raise ValueError(f"Unknown sign {self.query.sign}")
-        else:
-            return self.query.source, self.query.target
+                self._src_tgt = self.query.source, self.query.target
+        return self._src_tgt
 
 
 class PathQuery(UIQuery):
@@ -157,8 +205,11 @@ class PathQuery(UIQuery):
     # Map name for mapping to edge attribute key
     _weight_map = WEIGHT_NAME_MAPPING
 
+    __slots__ = ("_mesh_options",)
+
     def __init__(self, query: NetworkSearchQuery, hash_blacklist: Optional[Set[int]]):
         super().__init__(query, hash_blacklist=hash_blacklist)
+        self._mesh_options: Optional[Tuple[Set, Callable]] = None
 
     def _get_source_node(self) -> Tuple[Union[str, Tuple[str, int]], bool]:
         """Use for open ended path searches"""
@@ -168,7 +219,7 @@ class PathQuery(UIQuery):
             start_node, reverse = self.query.target, True
         else:
             raise InvalidParametersError(f"Cannot use {self.alg_name} with both source and target set.")
-        signed_node = get_open_signed_node(node=start_node, reverse=reverse, sign=self.query.get_int_sign())
+        signed_node = get_open_signed_node(node=start_node, reverse=reverse, sign=self._int_sign)
         return signed_node, reverse
 
     def alg_options(self) -> Dict[str, Any]:
@@ -181,7 +232,7 @@ class PathQuery(UIQuery):
 
     def run_options(self, graph: Optional[nx.DiGraph] = None) -> Dict[str, Any]:
         """Combines all options to one dict that can be sent to algorithm"""
-        return self.options(**self.alg_options(), **self.mesh_options(graph=graph)).dict()
+        return self.options.construct(**self.alg_options(), **self.mesh_options(graph=graph)).dict()
 
     def result_options(self) -> Dict:
         """Provide args to corresponding result class in result_handler
@@ -218,10 +269,14 @@ class PathQuery(UIQuery):
         """Get the necessary mesh options"""
         if self.query.mesh_ids is None or len(self.query.mesh_ids) == 0:
             raise InvalidParametersError("No mesh ids provided, but method " "for getting mesh options was called")
-        hash_mesh_dict: Dict[Any, Dict] = get_mesh_ref_counts(self.query.mesh_ids)
-        related_hashes: Set = set(hash_mesh_dict.keys())
-        ref_counts_from_hashes = _get_ref_counts_func(hash_mesh_dict) if get_func else None
-        return related_hashes, ref_counts_from_hashes
+        # The ref counts lookup queries the database; do it at most once
+        # per query instance
+        if self._mesh_options is None:
+            hash_mesh_dict: Dict[Any, Dict] = _cached_mesh_ref_counts(tuple(sorted(self.query.mesh_ids)))
+            related_hashes: Set = set(hash_mesh_dict.keys())
+            self._mesh_options = related_hashes, _get_ref_counts_func(hash_mesh_dict)
+        related_hashes, ref_counts_from_hashes = self._mesh_options
+        return related_hashes, (ref_counts_from_hashes if get_func else None)
 
 
 class ShortestSimplePathsQuery(PathQuery):
@@ -230,6 +285,8 @@ class ShortestSimplePathsQuery(PathQuery):
     alg_name: str = shortest_simple_paths.__name__
     options: ShortestSimplePathOptions = ShortestSimplePathOptions
 
+    __slots__ = ()
+
     def __init__(self, query: NetworkSearchQuery, hash_blacklist: Optional[Set[int]] = None):
         super().__init__(query, hash_blacklist=hash_blacklist)
 
@@ -277,6 +334,8 @@ class BreadthFirstSearchQuery(PathQuery):
     alg_name: str = bfs_search.__name__
     options: BaseModel = BreadthFirstSearchOptions
 
+    __slots__ = ()
+
     def __init__(self, query: NetworkSearchQuery, hash_blacklist: Optional[Set[int]] = None):
         super().__init__(query, hash_blacklist=hash_blacklist)
 
@@ -337,7 +396,7 @@ class BreadthFirstSearchQuery(PathQuery):
             "node_filter": self.query.allowed_ns,
             "node_blacklist": self._get_node_blacklist(),
             "terminal_ns": self.query.terminal_ns,
-            "sign": self.query.get_int_sign(),
+            "sign": self._int_sign,
             "max_memory": int(2 ** 29),  # Currently not set in UI
             "edge_filter": edge_filter_func,
         }
@@ -360,7 +419,10 @@ class BreadthFirstSearchQuery(PathQuery):
             if not isinstance(graph, nx.DiGraph):
                 raise InvalidParametersError(f"Must provide graph when running {self.alg_name} with " f"mesh options.")
             hashes, _ = self._get_mesh_options(get_func=False)
-            allowed_edges = {graph.graph["edge_by_hash"][h] for h in hashes if h in graph.graph["edge_by_hash"]}
+            # One .get() per hash instead of a membership test followed
+            # by a lookup in the same dict
+            edge_by_hash = graph.graph["edge_by_hash"]
+            allowed_edges = frozenset(e for e in (edge_by_hash.get(h) for h in hashes) if e is not None)
             _allow_edge_func = _get_allowed_edges_func(allowed_edges)
         else:
             hashes, _allow_edge_func = None, lambda u, v: True
@@ -377,6 +439,8 @@ class DijkstraQuery(PathQuery):
     alg_name: str = open_dijkstra_search.__name__
     options: DijkstraOptions = DijkstraOptions
 
+    __slots__ = ()
+
     def __init__(self, query: NetworkSearchQuery, hash_blacklist: Optional[Set[int]] = None):
         super().__init__(query, hash_blacklist=hash_blacklist)
 
@@ -428,8 +492,13 @@ class SharedInteractorsQuery(UIQuery):
     options: SharedInteractorsOptions = SharedInteractorsOptions
     reverse: bool = NotImplemented
 
+    __slots__ = ("_signed_source", "_signed_target")
+
     def __init__(self, query: NetworkSearchQuery, hash_blacklist: Optional[Set[int]] = None):
         super().__init__(query, hash_blacklist=hash_blacklist)
+        # Both alg_options and result_options need the signed nodes
+        self._signed_source = get_open_signed_node(node=query.source, reverse=self.reverse, sign=self._int_sign)
+        self._signed_target = get_open_signed_node(node=query.target, reverse=self.reverse, sign=self._int_sign)
 
     def alg_options(self) -> Dict[str, Any]:
         """Match arguments of shared_interactors from query
@@ -439,17 +508,15 @@ class SharedInteractorsQuery(UIQuery):
         :
             A dict with the arguments for shared_interactors
         """
-        source = get_open_signed_node(node=self.query.source, reverse=self.reverse, sign=self.query.get_int_sign())
-        target = get_open_signed_node(node=self.query.target, reverse=self.reverse, sign=self.query.get_int_sign())
         return {
-            "source": source,
-            "target": target,
+            "source": self._signed_source,
+            "target": self._signed_target,
             "allowed_ns": self.query.allowed_ns,
             "stmt_types": self.query.stmt_filter,
             "source_filter": None,  # Not implemented in UI
             "max_results": self.query.k_shortest,
             "regulators": self.reverse,
-            "sign": self.query.get_int_sign(),
+            "sign": self._int_sign,
             "hash_blacklist": self.hash_blacklist,
             "node_blacklist": self._get_node_blacklist(),
             "belief_cutoff": self.query.belief_cutoff,
@@ -458,17 +525,15 @@ class SharedInteractorsQuery(UIQuery):
 
     def run_options(self, graph: Optional[nx.DiGraph] = None) -> Dict[str, Any]:
         """Check query options and return them"""
-        return self.options(**self.alg_options()).dict()
+        return self.options.construct(**self.alg_options()).dict()
 
     def result_options(self) -> Dict:
         """Provide args to SharedInteractorsResultManager in result_handler"""
-        source = get_open_signed_node(node=self.query.source, reverse=self.reverse, sign=self.query.get_int_sign())
-        target = get_open_signed_node(node=self.query.target, reverse=self.reverse, sign=self.query.get_int_sign())
         return {
             "filter_options": self.query.get_filter_options(),
             "is_targets_query": not self.reverse,
-            "source": source,
-            "target": target,
+            "source": self._signed_source,
+            "target": self._signed_target,
         }
 
 
@@ -478,6 +543,8 @@ class SharedRegulatorsQuery(SharedInteractorsQuery):
     alg_name = "shared_regulators"
     reverse = True
 
+    __slots__ = ()
+
     def __init__(self, query: NetworkSearchQuery, hash_blacklist: Optional[Set[int]] = None):
         # bool(shared_regulators) == bool(reverse)
         if query.shared_regulators != self.reverse:
@@ -496,6 +563,8 @@ class SharedTargetsQuery(SharedInteractorsQuery):
     alg_name = "shared_targets"
     reverse = False
 
+    __slots__ = ()
+
 
 class OntologyQuery(UIQuery):
     """Check queries that will use shared_parents"""
@@ -503,6 +572,8 @@ class OntologyQuery(UIQuery):
     alg_name = shared_parents.__name__
     options: OntologyOptions = OntologyOptions
 
+    __slots__ = ()
+
     def __init__(self, query: NetworkSearchQuery):
         super().__init__(query, hash_blacklist=None)
 
@@ -552,7 +623,7 @@ class OntologyQuery(UIQuery):
             The options for shared_parents
         """
         ontology_options: Dict[str, str] = self._get_ontology_options(graph)
-        return self.options(**ontology_options, **self.alg_options()).dict()
+        return self.options.construct(**ontology_options, **self.alg_options()).dict()
 
     def result_options(self) -> Dict:
         """Provide args to OntologyResultManager in result_handler
@@ -579,6 +650,8 @@ class SubgraphQuery:
     alg_name: str = get_subgraph_edges.__name__
     options: SubgraphOptions = SubgraphOptions
 
+    __slots__ = ("query", "_nodes_in_graph", "_not_in_graph")
+
     def __init__(self, query: SubgraphRestQuery):
         self.query: SubgraphRestQuery = query
         self._nodes_in_graph: List[Node] = []
@@ -593,38 +666,48 @@ class SubgraphQuery:
         3. If not, set node as not in graph
         """
         ns_id2node = graph.graph["node_by_ns_id"]
+        graph_nodes = graph.nodes
+        # Bind the append methods; the loop may run over thousands of
+        # input nodes
+        in_graph_append = self._nodes_in_graph.append
+        not_in_graph_append = self._not_in_graph.append
         for node in self.query.nodes:
 
             # See if node is in mapping
             mapped_name = ns_id2node.get((node.namespace, node.identifier))
-            if mapped_name is not None and mapped_name in graph.nodes:
-                proper_node = Node(
+            if mapped_name is not None and mapped_name in graph_nodes:
+                # The fields come from the validated query and the
+                # graph mapping, so skip re-validation
+                proper_node = Node.construct(
                     name=mapped_name,
                     namespace=node.namespace,
                     identifier=node.identifier,
                 )
 
                 # Append to existing nodes
-                self._nodes_in_graph.append(proper_node)
+                in_graph_append(proper_node)
+                continue
 
-            # See if node name, if provided, is among nodes
-            elif node.name and node.name in graph.nodes:
+            # See if node name, if provided, is among nodes; fetch the
+            # node data once instead of one lookup per attribute
+            node_data = graph_nodes.get(node.name) if node.name else None
+            if node_data is not None:
                 # Check if ns/id are proper
-                if node.namespace != graph.nodes[node.name]["ns"] or node.identifier != graph.nodes[node.name]["id"]:
-                    proper_node = Node(
+                if node.namespace != node_data["ns"] or node.identifier != node_data["id"]:
+                    proper_node = Node.construct(
                         name=node.name,
-                        namespace=graph.nodes[node.name]["ns"],
-                        identifier=graph.nodes[node.name]["id"],
+                        namespace=node_data["ns"],
+                        identifier=node_data["id"],
                     )
                 else:
                     proper_node = node
 
                 # Append to existing nodes
-                self._nodes_in_graph.append(proper_node)
+                in_graph_append(proper_node)
 
             # Append to nodes not in graph
             else:
-                self._not_in_graph.append(node)
+                not_in_graph_append(node)
 
     def alg_options(self, graph: nx.DiGraph) -> Dict[str, List[Node]]:
         """Match arguments of get_subgraph_edges
@@ -656,7 +739,7 @@ class SubgraphQuery:
         :
             A dict with the arguments for get_subgraph_edges
         """
-        return self.options(**self.alg_options(graph)).dict()
+        return self.options.construct(**self.alg_options(graph)).dict()
 
     def result_options(self) -> Dict[str, Any]:
         """Return options needed for SubgraphResultManager
@@ -681,15 +764,15 @@ class MultiInteractorsQuery:
     alg_name: str = direct_multi_interactors.__name__
     options: Type[MultiInteractorsOptions] = MultiInteractorsOptions
 
+    __slots__ = ("query",)
+
     def __init__(self, rest_query: MultiInteractorsRestQuery):
         self.query = rest_query
 
     def _alg_options(self) -> Dict[str, Any]:
         # Add blacklisted hashes to the query
-        cc = CurationCache()
-        hash_blacklist: Set[int] = cc.get_all_hashes()
         query_dict = self.query.dict(exclude_defaults=True, exclude_unset=True)
-        query_dict["hash_blacklist"] = hash_blacklist
+        query_dict["hash_blacklist"] = _get_hash_blacklist(int(time.time() // _CURATION_TTL))
         return query_dict
 
     def run_options(self) -> Dict[str, Any]:
@@ -700,7 +783,7 @@ class MultiInteractorsQuery:
         :
             The options needed for direct_multi_interactors
         """
-        return self.options(**self._alg_options()).dict()
+        return self.options.construct(**self._alg_options()).dict()
 
     def result_options(self) -> Dict[str, Any]:
         """Return a dict with options for the MultiInteractorsResultManager
@@ -748,31 +831,43 @@ def get_open_signed_node(node: str, reverse: bool, sign: Optional[int] = None) -
     if sign is None:
         return node
     else:
-        # Upstream: return asked sign
+        # Upstream: return asked sign; callers pass the integer sign
+        # resolved by NetworkSearchQuery.get_int_sign, so no further
+        # mapping is needed
         if reverse:
-            return node, SIGNS_TO_INT_SIGN.get(sign)
+            return node, sign
         # Downstream: return positive node
         else:
             return node, INT_PLUS
 
 
-def _get_ref_counts_func(hash_mesh_dict: Dict):
-    def _func(graph: nx.DiGraph, u: str, v: str):
-        # Get hashes for edge
-        hashes = [d["stmt_hash"] for d in graph[u][v]["statements"]]
+@lru_cache(maxsize=1024)
+def _cached_mesh_ref_counts(mesh_ids: Tuple[str, ...]) -> Dict[Any, Dict]:
+    # Deduplicate the database roundtrip across queries asking for the
+    # same mesh terms; the key is order-insensitive since the result
+    # only depends on the set of ids
+    return get_mesh_ref_counts(list(mesh_ids))
+
 
-        # Get all relevant mesh counts
-        dicts: List[Dict] = [hash_mesh_dict.get(h, {"": 0, "total": 1}) for h in hashes]
+def _get_ref_counts_func(hash_mesh_dict: Dict):
+    # Precompute the ref count sum and total per hash once; the returned
+    # closure runs per edge inside the pathfinding inner loops, where it
+    # should not re-iterate the mesh count dicts
+    hash_stats: Dict[Any, Tuple[int, int]] = {
+        h: (sum(v for k, v in d.items() if k != "total"), d["total"] or 1) for h, d in hash_mesh_dict.items()
+    }
 
-        # Count references
+    def _func(graph: nx.DiGraph, u: str, v: str):
+        # Count references, keeping the stats of the statement with the
+        # highest ratio of mesh ref counts to total ref counts
         total = 1
         ref_counts = 0
-        max_ratio = 0
-        for d in dicts:
-            rc_sum = sum(v for k, v in d.items() if k != "total")
-            tot = d["total"] or 1
-            if rc_sum / tot > max_ratio:
-                max_ratio = rc_sum / tot
+        max_ratio = 0.0
+        for sd in graph[u][v]["statements"]:
+            rc_sum, tot = hash_stats.get(sd["stmt_hash"], (0, 1))
+            ratio = rc_sum / tot
+            if ratio > max_ratio:
+                max_ratio = ratio
                 ref_counts = rc_sum
                 total = tot
 
@@ -784,8 +879,12 @@ def _get_ref_counts_func(hash_mesh_dict: Dict):
 def _get_allowed_edges_func(
     allowed_edges: Set[StrEdge],
 ) -> Callable[[StrNode, StrNode], bool]:
+    # Freeze the set and bind its membership method once; the closure
+    # body is then a single C-level call per visited edge
+    edge_allowed = frozenset(allowed_edges).__contains__
+
     def _allow_edge_func(u: StrNode, v: StrNode):
-        return (u, v) in allowed_edges
+        return edge_allowed((u, v))
 
     return _allow_edge_func
 
@@ -796,15 +895,27 @@ def _get_edge_filter_func(
     check_curated: Optional[bool] = False,
     belief_cutoff: Optional[float] = 0.0,
 ) -> EdgeFilter:
+    # Normalize the filter collections once at construction; the closure
+    # runs per visited edge and the checks per statement, so membership
+    # tests must be O(1)
+    stmt_types = frozenset(s.lower() for s in stmt_types) if stmt_types else None
+    hash_blacklist = frozenset(hash_blacklist) if hash_blacklist else None
+
+    # Specialize the filter to the active options so disabled filters
+    # cost nothing per statement; the checks mirror pass_stmt
+    checks: List[Callable[[Dict[str, Any]], bool]] = []
+    if stmt_types:
+        checks.append(lambda sd: sd["stmt_type"].lower() in stmt_types)
+    if hash_blacklist:
+        checks.append(lambda sd: sd["stmt_hash"] not in hash_blacklist)
+    if check_curated:
+        checks.append(lambda sd: sd["curated"])
+    if belief_cutoff > 0:
+        checks.append(lambda sd: sd["belief"] >= belief_cutoff)
+
     def _edge_filter(g: nx.DiGraph, u: StrNode, v: StrNode) -> bool:
         for edge_stmt in g.edges[(u, v)]["statements"]:
-            if pass_stmt(
-                stmt_dict=edge_stmt,
-                stmt_types=stmt_types,
-                hash_blacklist=hash_blacklist,
-                check_curated=check_curated,
-                belief_cutoff=belief_cutoff,
-            ):
+            if all(check(edge_stmt) for check in checks):
                 return True
         return False
 
@@ -860,13 +971,15 @@ def pass_stmt(
     return True
 
 
-alg_name_query_mapping = {
-    bfs_search.__name__: BreadthFirstSearchQuery,
-    shortest_simple_paths.__name__: ShortestSimplePathsQuery,
-    open_dijkstra_search.__name__: DijkstraQuery,
-    shared_parents.__name__: OntologyQuery,
-    "shared_regulators": SharedRegulatorsQuery,
-    "shared_targets": SharedTargetsQuery,
-    get_subgraph_edges.__name__: SubgraphQuery,
-    direct_multi_interactors.__name__: MultiInteractorsQuery,
-}
+alg_name_query_mapping = MappingProxyType(
+    {
+        "bfs_search": BreadthFirstSearchQuery,
+        "shortest_simple_paths": ShortestSimplePathsQuery,
+        "open_dijkstra_search": DijkstraQuery,
+        "shared_parents": OntologyQuery,
+        "shared_regulators": SharedRegulatorsQuery,
+        "shared_targets": SharedTargetsQuery,
+        "get_subgraph_edges": SubgraphQuery,
+        "direct_multi_interactors": MultiInteractorsQuery,
+    }
+)
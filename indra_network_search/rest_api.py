@@ -210,7 +210,7 @@ async def server_status():
     return STATUS
 
 
-@app.post("/query", response_model=Results)
+@app.post("/query", response_model=Results, response_model_exclude_none=True)
 def query(search_query: NetworkSearchQuery, background_tasks: BackgroundTasks):
     """Interface with IndraNetworkSearchAPI.handle_query
 
@@ -238,14 +238,14 @@ def query(search_query: NetworkSearchQuery, background_tasks: BackgroundTasks):
             logger.info("Result could not be validated, re-running search")
             results = network_search_api.handle_query(rest_query=search_query)
             logger.info("Uploading results to S3")
-            background_tasks.add_task(dump_result_json_to_s3, query_hash, results.dict())
+            background_tasks.add_task(dump_result_json_to_s3, query_hash, results.dict(exclude_none=True))
             background_tasks.add_task(dump_query_json_to_s3, query_hash, search_query.dict())
 
     else:
         logger.info("Performing new search")
         results = network_search_api.handle_query(rest_query=search_query)
         logger.info("Uploading results to S3")
-        background_tasks.add_task(dump_result_json_to_s3, query_hash, results.dict())
+        background_tasks.add_task(dump_result_json_to_s3, query_hash, results.dict(exclude_none=True))
         background_tasks.add_task(dump_query_json_to_s3, query_hash, search_query.dict())
 
     return results
@@ -2,8 +2,12 @@
 import inspect
 import json
 import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from os import path
 from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Union
+from zlib import crc32
 
 import networkx as nx
 from botocore.exceptions import ClientError
@@ -17,7 +21,6 @@ from depmap_analysis.util.aws import (
     get_s3_file_tree,
 )
 from depmap_analysis.util.io_functions import file_opener
-from fnvhash import fnv1a_32
 from indra_db.util.s3_path import S3Path
 
 __all__ = [
@@ -79,8 +82,23 @@ def sorted_json_string(jsonable_dict: Dict) -> str:
         raise TypeError("Invalid type: %s" % type(jsonable_dict))
 
 
+def _sort_lists(json_obj: Any) -> Any:
+    """Return a copy of a json structure with all lists sorted
+
+    Sorting the list values keeps the query hash insensitive to the order
+    of list fields like stmt_filter and allowed_ns, matching the behavior
+    of sorted_json_string.
+    """
+    if isinstance(json_obj, dict):
+        return {k: _sort_lists(v) for k, v in json_obj.items()}
+    elif isinstance(json_obj, (list, tuple)):
+        items = [_sort_lists(it) for it in json_obj]
+        return sorted(items, key=lambda it: json.dumps(it, sort_keys=True))
+    return json_obj
+
+
 def get_query_hash(query_json: Dict, ignore_keys: Optional[Union[Set, List]] = None) -> int:
-    """Create an FNV-1a 32-bit hash from the query json
+    """Create a CRC32 hash from the query json
 
     Parameters
     ----------
@@ -93,29 +111,47 @@ def get_query_hash(query_json: Dict, ignore_keys: Optional[Union[Set, List]] = N
     Returns
     -------
     :
-        An FNV-1a 32-bit hash of the query json ignoring the keys in
-        ignore_keys
+        A CRC32 hash of the query json ignoring the keys in ignore_keys
     """
     if ignore_keys:
-        if set(ignore_keys).difference(query_json.keys()):
-            missing = set(ignore_keys).difference(query_json.keys())
+        missing = set(ignore_keys).difference(query_json.keys())
+        if missing:
             logger.warning(
                 'Ignore key(s) "%s" are not in the provided query_json and '
                 "will be skipped..." % str('", "'.join(missing))
             )
         query_json = {k: v for k, v in query_json.items() if k not in ignore_keys}
-    return fnv1a_32(sorted_json_string(query_json).encode("utf-8"))
+    canonical = json.dumps(_sort_lists(query_json), sort_keys=True, separators=(",", ":"))
+    return crc32(canonical.encode("utf-8"))
+
+
+@lru_cache(maxsize=2)
+def _get_s3(unsigned: bool) -> Any:
+    """Return a cached S3 client; boto3 client construction is expensive"""
+    return get_s3_client(unsigned=unsigned)
+
+
+# Refresh the S3 graph listing at most once every five minutes
+_GRAPHS_TTL = 300
 
 
 def get_latest_graphs() -> Dict[str, str]:
     """Return the s3 urls to the latest unsigned and signed graphs available
 
+    The result is cached and refreshed at most once every five minutes,
+    since listing the graphs requires paginating the S3 file tree.
+
     Returns
     -------
     :
         A dict of the S3 keys of the latest unsigned and signed graphs
     """
-    s3 = get_s3_client(unsigned=False)
+    return _get_latest_graphs(int(time.time() // _GRAPHS_TTL))
+
+
+@lru_cache(maxsize=1)
+def _get_latest_graphs(time_bucket: int) -> Dict[str, str]:
+    s3 = _get_s3(unsigned=False)
     tree = get_s3_file_tree(s3=s3, bucket=NET_BUCKET, prefix=NETS_PREFIX, with_dt=True)
     keys = [key for key in tree.gets("key") if key[0].endswith(".pkl")]
 
@@ -213,29 +249,33 @@ def load_indra_graph(
         # Load from S3
         latest_graphs = get_latest_graphs()
 
-        if unsigned_graph:
-            if latest_graphs.get(INDRA_DG):
-                indra_dir_graph = file_opener(latest_graphs[INDRA_DG])
-            else:
-                logger.warning(f"{INDRA_DG} was not found")
-
-        if unsigned_multi_graph:
-            if latest_graphs.get(INDRA_MDG):
-                indra_multi_di_graph = file_opener(latest_graphs[INDRA_MDG])
-            else:
-                logger.warning(f"{INDRA_MDG} was not found")
-
-        if sign_node_graph:
-            if latest_graphs.get(INDRA_SNG):
-                indra_signed_node_graph = file_opener(latest_graphs[INDRA_SNG])
-            else:
-                logger.warning(f"{INDRA_SNG} was not found")
-
-        if sign_edge_graph:
-            if latest_graphs.get(INDRA_SEG):
-                indra_signed_edge_graph = file_opener(latest_graphs[INDRA_SEG])
-            else:
-                logger.warning(f"{INDRA_SEG} was not found")
+        # The downloads are independent and network bound, so overlap them
+        # in a thread pool instead of fetching one graph at a time
+        to_load = []
+        for load, graph_type in [
+            (unsigned_graph, INDRA_DG),
+            (unsigned_multi_graph, INDRA_MDG),
+            (sign_node_graph, INDRA_SNG),
+            (sign_edge_graph, INDRA_SEG),
+        ]:
+            if load:
+                if latest_graphs.get(graph_type):
+                    to_load.append(graph_type)
+                else:
+                    logger.warning(f"{graph_type} was not found")
+
+        loaded_graphs = {}
+        if to_load:
+            with ThreadPoolExecutor(max_workers=len(to_load)) as executor:
+                futures = {
+                    graph_type: executor.submit(file_opener, latest_graphs[graph_type]) for graph_type in to_load
+                }
+                loaded_graphs = {graph_type: future.result() for graph_type, future in futures.items()}
+
+        indra_dir_graph = loaded_graphs.get(INDRA_DG)
+        indra_multi_di_graph = loaded_graphs.get(INDRA_MDG)
+        indra_signed_node_graph = loaded_graphs.get(INDRA_SNG)
+        indra_signed_edge_graph = loaded_graphs.get(INDRA_SEG)
 
     return (
         indra_dir_graph,
@@ -323,30 +363,27 @@ def check_existence_and_date_s3(query_hash: Union[int, str]) -> Dict[str, str]:
     :
         Dict with S3 key for query and corresponding result, if they exist
     """
-    s3 = get_s3_client(unsigned=False)
-    key_prefix = "indra_network_search/%s" % query_hash
-    query_json_key = key_prefix + "_query.json"
-    result_json_key = key_prefix + "_result.json"
+    s3 = _get_s3(unsigned=False)
+    key_prefix = "indra_network_search/%s_" % query_hash
+    query_json_key = key_prefix + "query.json"
+    result_json_key = key_prefix + "result.json"
     exists_dict = {}
 
-    # Get query json
+    # List both objects in a single request instead of one head_object
+    # round trip per key
     try:
-        query_json = s3.head_object(Bucket=DUMPS_BUCKET, Key=query_json_key)
+        resp = s3.list_objects_v2(Bucket=DUMPS_BUCKET, Prefix=key_prefix, MaxKeys=5)
     except ClientError:
-        query_json = ""
-    if query_json:
+        return exists_dict
+    existing_keys = {obj["Key"] for obj in resp.get("Contents", [])}
+    if query_json_key in existing_keys:
         exists_dict["query_json_key"] = S3Path.from_key_parts(DUMPS_BUCKET, query_json_key).to_string()
-
-    # Get result json
-    try:
-        result_json = s3.head_object(Bucket=DUMPS_BUCKET, Key=result_json_key)
-    except ClientError:
-        result_json = ""
-    if result_json:
+    if result_json_key in existing_keys:
         exists_dict["result_json_key"] = S3Path.from_key_parts(DUMPS_BUCKET, result_json_key).to_string()
     return exists_dict
 
 
+@lru_cache(maxsize=None)
 def get_default_args(func: Callable) -> Dict[str, Any]:
     """Returns the default args of a function as a dictionary
 
@@ -370,6 +407,7 @@ def get_default_args(func: Callable) -> Dict[str, Any]:
     return {k: v.default for k, v in signature.parameters.items() if v.default is not inspect.Parameter.empty}
 
 
+@lru_cache(maxsize=None)
 def get_mandatory_args(func: Callable) -> Set[str]:
     """Returns the mandatory args for a function as a set
 
@@ -406,9 +444,7 @@ def is_context_weighted(mesh_id_list: List[str], strict_filtering: bool) -> bool
         True for the combination of mesh ids being present and unstrict
         filtering, otherwise False
     """
-    if mesh_id_list and not strict_filtering:
-        return True
-    return False
+    return bool(mesh_id_list) and not strict_filtering
 
 
 def is_weighted(weighted: bool, mesh_ids: List[str], strict_mesh_filtering: bool) -> bool:
@@ -428,8 +464,4 @@ def is_weighted(weighted: bool, mesh_ids: List[str], strict_mesh_filtering: bool
     :
         True if the combination is either weighted or context weighted
     """
-    if mesh_ids:
-        ctx_w = is_context_weighted(mesh_id_list=mesh_ids, strict_filtering=strict_mesh_filtering)
-        return weighted or ctx_w
-    else:
-        return weighted
+    return weighted or (bool(mesh_ids) and not strict_mesh_filtering)
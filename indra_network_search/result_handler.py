@@ -144,8 +144,9 @@ class ResultManager:
         node_info["namespace"] = db_ns
         node_info["identifier"] = db_id
 
-        # Create Node
-        node = Node(**node_info)
+        # Create Node; the values come straight from the graph, which is
+        # already validated at load time, so skip the pydantic validators
+        node = Node.construct(**node_info)
 
         # Check if we need to filter node; Skip by default if the node
         # belongs to the input nodes
@@ -34,7 +34,7 @@ def test_shared_targets():
 
     res = shared_interactors(graph=idg, source=source, target=target, regulators=False)
     res_list = [t for t in res]
-    assert ([source, shared_target], [target, shared_target]) in res_list
+    assert ((source, shared_target), (target, shared_target)) in res_list
 
 
 def test_shared_targets_w_big_graph():
@@ -70,7 +70,7 @@ def test_shared_regulators():
 
     res = shared_interactors(graph=idg, source=source, target=target, regulators=True)
     res_list = [t for t in res]
-    assert ([shared_regulator, source], [shared_regulator, target]) in res_list
+    assert ((shared_regulator, source), (shared_regulator, target)) in res_list
 
 
 mock_edge_dict = {
@@ -354,6 +354,21 @@ def test_multi_interactors_belief_cutoff():
     assert res_set == {"AR", "testosterone", "NR2C2"}
 
 
+def test_multi_interactors_combined_filters():
+    # All active filters must apply together: testosterone and NR2C2 pass
+    # the belief cutoff but not the stmt type filter and must be excluded
+    input_nodes = ["BRCA1", "HDAC3"]
+    res_iter = direct_multi_interactors(
+        graph=expanded_unsigned_graph,
+        nodes=input_nodes,
+        downstream=True,
+        stmt_types=["activation"],
+        belief_cutoff=0.9995,
+    )
+    res_set = set(res_iter)
+    assert res_set == {"AR"}
+
+
 def test_multi_interactors_curated_db_only():
     input_nodes = ["BRCA1", "HDAC3"]
     res_iter = direct_multi_interactors(